@@ -4,10 +4,14 @@ This module generates the documentation pages in docs/source/_generated from
 the yml files in docs/yml.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import bs4
+import hashlib
+import io
 import itertools
 import os
+import pickle
 import re
 import sys
 import yaml
@@ -16,6 +20,11 @@ from bs4 import BeautifulSoup
 from os.path import isfile
 from functools import lru_cache
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Function names follow the pattern outputtype_something_inputtype, so
 # e.g. rst_something_yml
 
@@ -37,7 +46,33 @@ __REWRITES_ACTUAL = 0
 __WARNINGS = 0
 
 __DOXY_DICT = {}
-__RST_FILES_WRITTEN = {}
+__DOXY_NAMESPACES_PARSED = False
+__RST_FILES_WRITTEN = set()
+
+_YML_CACHE_DIR = "build/yml_cache"
+
+# Pattern and replacements used by filename_from_cppname, the i-th group of
+# the pattern is replaced by the i-th entry of _OPERATOR_FNAMES
+_RE_OPERATOR = re.compile(
+    r"(operator\s*\*)|(operator!=)|(operator\(\))|(operator\<\<)|(operator==)"
+    r"|(operator\>)|(operator<$)"
+)
+_OPERATOR_FNAMES = (
+    None,
+    "operator_star",
+    "operator_not_eq",
+    "call_operator",
+    "insertion_operator",
+    "operator_equal_to",
+    "operator_greater",
+    "operator_less",
+)
+_RE_NONWORD = re.compile(r"[\W]")
+
+# Patterns used by doxy_filename
+_RE_UNDERSCORE = re.compile(r"_")
+_RE_COLONCOLON = re.compile(r"::")
+_RE_UPPER = re.compile(r"([A-Z])")
 
 ########################################################################
 # Internal functions
@@ -46,6 +81,9 @@ __RST_FILES_WRITTEN = {}
 
 def __accepts(*types):
     def check_accepts(f):
+        if not __debug__:
+            # Don't wrap f at all if assertions are disabled (python -O)
+            return f
         assert len(types) == f.__code__.co_argcount
 
         def new_f(*args, **kwds):
@@ -59,7 +97,6 @@ def __accepts(*types):
     return check_accepts
 
 
-@__accepts(str, str)
 def __warn(fname, msg):
     global __WARNINGS
     __WARNINGS += 1
@@ -68,15 +105,48 @@ def __warn(fname, msg):
     )
 
 
-@__accepts(str, (str, None))
 def __info(msg, fname=None):
-    assert isinstance(msg, str)
     if fname is not None:
         sys.stdout.write("%s: %s\n" % (fname, msg))
     else:
         sys.stdout.write("%s\n" % msg)
 
 
+@lru_cache(maxsize=None)
+@__accepts(str)
+def __mtime(fname):
+    return os.path.getmtime(fname)
+
+
+@__accepts(str, str)
+def __yml_cache_filename(ymlfname, ext):
+    return os.path.join(
+        _YML_CACHE_DIR, hashlib.sha1(ymlfname.encode("utf-8")).hexdigest() + ext
+    )
+
+
+@__accepts(str)
+def __load_yml(ymlfname):
+    # The parsed yml is pickled in _YML_CACHE_DIR, keyed by the path and
+    # mtime of the yml file, so that unchanged files aren't parsed again.
+    key = (ymlfname, __mtime(ymlfname))
+    cache_fname = __yml_cache_filename(ymlfname, ".pkl")
+    try:
+        with open(cache_fname, "rb") as f:
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    with open(ymlfname, "r") as f:
+        ymldic = yaml.load(f, Loader=YamlLoader)
+    os.makedirs(_YML_CACHE_DIR, exist_ok=True)
+    with open(cache_fname + ".tmp", "wb") as f:
+        pickle.dump(key, f)
+        pickle.dump(ymldic, f)
+    os.replace(cache_fname + ".tmp", cache_fname)
+    return ymldic
+
+
 @__accepts(float)
 def __time_since_epoch_to_human(n):
     try:
@@ -89,17 +159,21 @@ def __time_since_epoch_to_human(n):
 def __write_file_if_changed(fname, contents):
     global __REWRITES_ATTEMPTED, __REWRITES_ACTUAL
     __REWRITES_ATTEMPTED += 1
-    __RST_FILES_WRITTEN[fname] = True
-    if os.path.exists(fname) and os.path.isfile(fname):
+    __RST_FILES_WRITTEN.add(os.path.normpath(fname))
+    try:
         with open(fname, "r") as f:
-            file_contents = f.read()
-            if file_contents == contents:
+            if f.read() == contents:
                 __info("NOT rewriting docs/%s  ..." % fname)
                 return
-    with open(fname, "w") as f:
-        __info("Rewriting docs/%s ..." % fname)
-        __REWRITES_ACTUAL += 1
+    except FileNotFoundError:
+        pass
+    __info("Rewriting docs/%s ..." % fname)
+    __REWRITES_ACTUAL += 1
+    # Write to a temporary file and then move it into place, so that the file
+    # is never left half written.
+    with open(fname + ".tmp", "w") as f:
         f.write(contents)
+    os.replace(fname + ".tmp", fname)
 
 
 @__accepts(int)
@@ -125,11 +199,11 @@ def __summary():
 
 
 def __clean_up():
-    for fname in os.listdir("source/_generated"):
-        fname = os.path.join("source/_generated", fname)
-        if fname not in __RST_FILES_WRITTEN:
-            __info(fname, "deleting!!!")
-            os.remove(fname)
+    with os.scandir("source/_generated") as it:
+        for entry in it:
+            if os.path.normpath(entry.path) not in __RST_FILES_WRITTEN:
+                __info(entry.path, "deleting!!!")
+                os.remove(entry.path)
 
 
 ########################################################################
@@ -137,27 +211,15 @@ def __clean_up():
 ########################################################################
 
 
+@lru_cache(maxsize=None)
 @__accepts(str)
 def filename_from_cppname(name):
-    p = re.compile(r"operator\s*\*")
-    name = p.sub("operator_star", name)
-    p = re.compile(r"operator!=")
-    name = p.sub("operator_not_eq", name)
-    p = re.compile(r"operator\(\)")
-    name = p.sub("call_operator", name)
-    p = re.compile(r"operator<$")
-    name = p.sub("operator_less", name)
-    p = re.compile(r"operator\<\<")
-    name = p.sub("insertion_operator", name)
-    p = re.compile(r"operator==")
-    name = p.sub("operator_equal_to", name)
-    p = re.compile(r"operator\>")
-    name = p.sub("operator_greater", name)
-    p = re.compile(r"[\W]")
-    name = p.sub("_", name)
+    name = _RE_OPERATOR.sub(lambda m: _OPERATOR_FNAMES[m.lastindex], name)
+    name = _RE_NONWORD.sub("_", name)
     return name.lower()
 
 
+@lru_cache(maxsize=None)
 @__accepts(str)
 def overview_filename(name):
     return os.path.join(
@@ -165,6 +227,7 @@ def overview_filename(name):
     )
 
 
+@lru_cache(maxsize=None)
 @__accepts(str, str)
 def subpage_filename(class_, name):
     return os.path.join(
@@ -201,12 +264,13 @@ def compare_yml_to_doxy(ymlfname, ymldic):
     class_ = next(iter(ymldic))
     try:
         doxy_xml(class_)  # to ensure that __DOXY_DICT is populated
-    except:
+    except (KeyError, OSError):
+        # Either there's no doxygen output for class_, or none at all
         return
 
     yml = next(iter(ymldic.values()))
     if yml is None:
-        yml = {}
+        yml = set()
     else:
         yml = [next(iter(x.values())) for x in yml]
         yml = itertools.chain.from_iterable(yml)
@@ -214,8 +278,8 @@ def compare_yml_to_doxy(ymlfname, ymldic):
         yml = [extract_yml_func_signature(x) for x in yml]
         yml = [x if x[1] is not None else (x[0]) for x in yml]
         yml = ["".join(x) for x in yml]
-        yml = {class_ + "::" + x: True for x in yml}
-    yml[class_] = True
+        yml = {class_ + "::" + x for x in yml}
+    yml.add(class_)
 
     dict_keys = type({}.keys())
 
@@ -241,13 +305,13 @@ def compare_yml_to_doxy(ymlfname, ymldic):
     doxy = [x for x in doxy if not destructor in x]
     doxy = [x for x in doxy if not "::::" in x]
     doxy = [x for x in doxy if not x.endswith("= 0")]
-    for x in doxy:
-        if not x in yml:
-            __warn(
-                ymlfname,
-                'missing doc, found "%s" in doxygen output but not in yml file'
-                % x,
-            )
+    missing = ['- "%s"' % x for x in doxy if not x in yml]
+    if len(missing) != 0:
+        __warn(
+            ymlfname,
+            "missing doc, found in doxygen output but not in yml file:\n"
+            + "\n".join(missing),
+        )
 
 
 ########################################################################
@@ -287,12 +351,15 @@ def doxy_run():
         __info("The folder docs/build/xml does not exist!")
         return True
     last_changed_source = [0, ""]
-    for f in os.listdir("../include/libsemigroups"):
-        if not f.startswith("."):
-            f = os.path.join("../include/libsemigroups", f)
-            if os.path.isfile(f) and f.endswith(".hpp"):
-                if os.path.getmtime(f) > last_changed_source[0]:
-                    last_changed_source = [os.path.getmtime(f), f]
+    # os.scandir is used so that each file is only stat'ed once
+    with os.scandir("../include/libsemigroups") as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.name.endswith(".hpp"):
+                continue
+            if entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > last_changed_source[0]:
+                    last_changed_source = [mtime, entry.path]
 
     __info(
         "the last changed header file is:  "
@@ -302,11 +369,16 @@ def doxy_run():
     )
     last_changed_source = last_changed_source[0]
     first_built_file = [float("inf"), ""]
-    for root, dirs, files in os.walk("build/xml"):
-        for f in files:
-            f = os.path.join(root, f)
-            if os.path.getmtime(f) < first_built_file[0]:
-                first_built_file = [os.path.getmtime(f), f]
+    dirs = ["build/xml"]
+    while len(dirs) != 0:
+        with os.scandir(dirs.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime < first_built_file[0]:
+                    first_built_file = [mtime, entry.path]
     __info(
         "\nthe first built xml file is:  "
         + first_built_file[1]
@@ -319,21 +391,36 @@ def doxy_run():
     return first_built_file < last_changed_source
 
 
+def doxy_last_modified():
+    result = 0.0
+    try:
+        with os.scandir("build/xml") as it:
+            for entry in it:
+                result = max(result, entry.stat().st_mtime)
+    except FileNotFoundError:
+        pass
+    return result
+
+
 @lru_cache(maxsize=None)
 @__accepts(str)
 def doxy_filename(name):
-    name = re.sub("_", "__", name)
-    # TODO use re.sub
-    p = re.compile(r"::")
-    name = p.sub("_1_1", name)
-    p = re.compile(r"([A-Z])")
-    name = p.sub(r"_\1", name).lower()
+    name = _RE_UNDERSCORE.sub("__", name)
+    name = _RE_COLONCOLON.sub("_1_1", name)
+    name = _RE_UPPER.sub(r"_\1", name).lower()
     if isfile("build/xml/class" + name + ".xml"):
         return "build/xml/class" + name + ".xml"
     else:
         return "build/xml/struct" + name + ".xml"
 
 
+@__accepts(str)
+def doxy_parse_xml(fname):
+    # Open in binary mode so that lxml does the decoding rather than Python
+    with open(fname, "rb") as f:
+        return BeautifulSoup(f, "lxml-xml")
+
+
 @lru_cache(maxsize=None)
 @__accepts(str, str, (str, type(None)))
 def doxy_warn(fname, name, params=None):
@@ -344,14 +431,14 @@ def doxy_warn(fname, name, params=None):
 @lru_cache(maxsize=None)
 @__accepts(str, (str, type(None)))
 def doxy_xml(name, params=None):
-    global __DOXY_DICT
+    global __DOXY_DICT, __DOXY_NAMESPACES_PARSED
     if not name in __DOXY_DICT:
         class_ = name
         pos = class_.rfind("::")
         while pos != -1 and not isfile(doxy_filename(class_)):
             class_, pos = class_[:pos], class_.rfind("::")
         if isfile(doxy_filename(class_)) and not class_ in __DOXY_DICT:
-            xml = BeautifulSoup(open(doxy_filename(class_), "r"), "xml")
+            xml = doxy_parse_xml(doxy_filename(class_))
             __DOXY_DICT[class_] = xml.find("compounddef")
             for x in xml.find_all("memberdef"):
                 if "prot" in x.attrs and x.attrs["prot"] != "public":
@@ -368,25 +455,27 @@ def doxy_xml(name, params=None):
                 tparam = x.find("templateparamlist")
                 if tparam is not None:
                     tparam = tparam.find_all("param")
-                    tparam = [x.find("type").text.strip() for x in tparam]
+                    tparam = {x.find("type").text.strip() for x in tparam}
                 param = x.find_all("param")
                 param = [x.find("type").text.strip() for x in param]
                 if tparam is not None:
                     param = [x for x in param if x not in tparam]
                 param = "(" + ",".join(param) + ")"
+                # x.argsstring searches the children of x, so only do it once
+                argsstring = x.argsstring.text
                 if "const" in x.attrs and x.attrs["const"] == "yes":
                     param += " const"
-                elif x.argsstring.text.endswith(" const"):
+                elif argsstring.endswith(" const"):
                     param += " const"
                 if "noexcept" in x.attrs and x.attrs["noexcept"] == "yes":
                     param += " noexcept"
-                if x.argsstring.text.endswith("=default"):
+                if argsstring.endswith("=default"):
                     param += " = default"
-                if x.argsstring.text.endswith("=delete"):
+                if argsstring.endswith("=delete"):
                     param += " = delete"
-                if x.argsstring.text.endswith(" override"):
+                if argsstring.endswith(" override"):
                     param += " override"
-                if x.argsstring.text.endswith("=0"):
+                if argsstring.endswith("=0"):
                     param += " = 0"
                 if not mem_def_name in __DOXY_DICT:
                     __DOXY_DICT[mem_def_name] = {}
@@ -396,11 +485,14 @@ def doxy_xml(name, params=None):
                 # &amp;word, element_index_type pos) const)
                 __DOXY_DICT[mem_def_name][param] = x
 
-        elif not class_ in __DOXY_DICT:
+        elif not class_ in __DOXY_DICT and not __DOXY_NAMESPACES_PARSED:
+            # The namespace files only need to be parsed once, if name isn't
+            # found in them the first time, then it won't be found later.
+            __DOXY_NAMESPACES_PARSED = True
             for fname in os.listdir("build/xml"):
                 if not fname.startswith("namespace"):
                     continue
-                xml = BeautifulSoup(open("build/xml/" + fname, "r"), "xml")
+                xml = doxy_parse_xml("build/xml/" + fname)
                 ns = xml.find("compoundname").text
                 for x in xml.find_all("memberdef"):
                     y = x.find("name").text
@@ -526,7 +618,6 @@ def doxy_tparams(ymlfname, name, params=None):
 
 
 # TODO this is way too general for what it's used for here
-@__accepts(bs4.element.Tag, list)
 def convert_to_rst(xml, context=[]):
     context.append(xml.name)
     if "kind" in xml.attrs and xml.attrs["kind"] == "enum":
@@ -736,92 +827,123 @@ def rst_doxy(kind, class_, yml_entry=None):
         )
 
 
-@__accepts(str)
-def rst_generate_overview(ymlfname):
-    with open(ymlfname, "r") as f:
-        out = _COPYRIGHT_NOTICE
-        ymldic = yaml.load(f, Loader=yaml.FullLoader)
-        compare_yml_to_doxy(ymlfname, ymldic)
-        name = next(iter(ymldic))  # object name
-        out += rst_section(strip_libsemigroups_prefix(name))
+@__accepts(str, str, list)
+def rst_overview_table(ymlfname, name, things):
+    out = ".. list-table::\n"
+    out += "   :widths: 50 50\n"
+    out += "   :header-rows: 0\n\n"
+    for thing in things:
+        thing_name, thing_params = extract_yml_func_signature(thing)
+        title = ""
+        if thing == unqualified_name(name) + "()":
+            #  Special case for the default constructor
+            title = thing
+            thing = "%s::%s" % (
+                thing_name,
+                thing,
+            )
+        thing_name = name + "::" + thing_name
+        tparams = doxy_tparams(ymlfname, thing_name, thing_params)
+        if tparams != "":
+            # Escape first template < !
+            title = re.sub("<", r"\<", thing, 1)
+
+        if title != "":
+            # Use different title and link text
+            out += "   * - :cpp:member:`%s <%s%s>`\n     - %s\n" % (
+                title,
+                tparams,
+                thing,
+                doxy_brief(ymlfname, thing_name, thing_params),
+            )
+        else:
+            out += "   * - :cpp:member:`%s`\n     - %s\n" % (
+                thing,
+                doxy_brief(ymlfname, thing_name, thing_params),
+            )
+    return out
+
+
+@__accepts(str, str, str, (str, type(None)), list)
+def rst_subpage(ymlfname, name, subname, intro, things):
+    out = _COPYRIGHT_NOTICE + rst_section(subname)
+    out += ".. cpp:namespace:: libsemigroups\n\n"
+    if intro is not None:
+        out += intro + "\n\n"
+    out += ".. cpp:namespace-pop::\n\n"
+    for thing in things:
         try:
-            out += rst_doxy(doxy_kind(ymlfname, name), name)
+            (
+                thing_name,
+                thing_params,
+            ) = extract_yml_func_signature(thing)
+
+            if thing_params == "(bool(*)())":
+                # TODO improve this
+                thing = thing_name + "(bool (*func)())"
+            thing_name = name + "::" + thing_name
+            out += rst_doxy(
+                doxy_kind(ymlfname, thing_name, thing_params),
+                name,
+                thing,
+            )
         except:
-            __warn(ymlfname, "no doxygen output found for " + name)
-            return
+            doxy_warn(ymlfname, thing_name, thing_params)
+    return out
+
+
+@__accepts(dict)
+def rst_filenames(ymldic):
+    name = next(iter(ymldic))
+    result = [overview_filename(name)]
+    if ymldic[name] is not None:
+        for sectdic in ymldic[name]:
+            subname = next(iter(sectdic))
+            if sectdic[subname] is not None:
+                result.append(subpage_filename(name, subname))
+    return result
+
+
+@__accepts(str, list, float)
+def rst_is_up_to_date(stampfname, rstfnames, last_changed_input):
+    # The rst files are only rewritten when their content changes, so their
+    # mtimes can't be used here, instead we use the mtime of stampfname,
+    # which is touched every time the rst files are generated.
+    try:
+        if os.path.getmtime(stampfname) <= last_changed_input:
+            return False
+    except FileNotFoundError:
+        return False
+    return all(isfile(x) for x in rstfnames)
+
+
+@__accepts(str, dict)
+def rst_generate(ymlfname, ymldic):
+    # The overview page and the subpages are generated in a single pass over
+    # the sections of the yml file.
+    compare_yml_to_doxy(ymlfname, ymldic)
+    name = next(iter(ymldic))  # object name
+    out = _COPYRIGHT_NOTICE
+    out += rst_section(strip_libsemigroups_prefix(name))
+    try:
+        out += rst_doxy(doxy_kind(ymlfname, name), name)
         out += "\n.. cpp:namespace:: %s\n\n" % name
+    except:
+        __warn(ymlfname, "no doxygen output found for " + name)
+        out = None
+    subpages = []
+    if ymldic[name] is not None:
         toc = "\n.. toctree::\n   :hidden:\n"
-        if ymldic[name] is not None:
-            for sectdic in ymldic[name]:
-                subname = next(iter(sectdic))
+        for sectdic in ymldic[name]:
+            subname = next(iter(sectdic))
+            rstfname = subpage_filename(name, subname)
+            toc += "\n   " + rstfname[rstfname.rfind("/") + 1 :]
+            if out is not None:
                 out += rst_section(subname, "-")
-                fnam = subpage_filename(name, subname)
-                toc += "\n   " + fnam[fnam.rfind("/") + 1 :]
-                if sectdic[subname] is not None:
-                    out += ".. list-table::\n"
-                    out += "   :widths: 50 50\n"
-                    out += "   :header-rows: 0\n\n"
-                    things = sectdic[subname]
-                    if isinstance(things[0], list):
-                        things = things[1:]
-                    for thing in sorted(things):
-                        thing_name, thing_params = extract_yml_func_signature(
-                            thing
-                        )
-                        title = ""
-                        if thing == unqualified_name(name) + "()":
-                            #  Special case for the default constructor
-                            title = thing
-                            thing = "%s::%s" % (
-                                thing_name,
-                                thing,
-                            )
-                        thing_name = name + "::" + thing_name
-                        tparams = doxy_tparams(
-                            ymlfname, thing_name, thing_params
-                        )
-                        if tparams != "":
-                            # Escape first template < !
-                            title = re.sub("<", r"\<", thing, 1)
-
-                        if title != "":
-                            # Use different title and link text
-                            out += (
-                                "   * - :cpp:member:`%s <%s%s>`\n     - %s\n"
-                                % (
-                                    title,
-                                    tparams,
-                                    thing,
-                                    doxy_brief(
-                                        ymlfname, thing_name, thing_params
-                                    ),
-                                )
-                            )
-                        else:
-                            out += "   * - :cpp:member:`%s`\n     - %s\n" % (
-                                thing,
-                                doxy_brief(ymlfname, thing_name, thing_params),
-                            )
-
-            out += toc + "\n"
-        __write_file_if_changed(overview_filename(name), out)
-
-
-@__accepts(str)
-def rst_generate_subpages(ymlfname):
-    with open(ymlfname, "r") as f:
-        ymldic = yaml.load(f, Loader=yaml.FullLoader)
-        name = next(iter(ymldic))
-        if ymldic[name] is None:
-            return
-        for sectiondic in ymldic[name]:
-            subname = next(iter(sectiondic))
-            if sectiondic[subname] is None:
+            things = sectdic[subname]
+            if things is None:
                 continue
-            rstfname = subpage_filename(name, subname)
-            out = _COPYRIGHT_NOTICE + rst_section(subname)
-            out += ".. cpp:namespace:: libsemigroups\n\n"
-            things = sectiondic[subname]
+            intro = None
             if isinstance(things[0], list):
                 assert (
                     len(things[0]) == 1
@@ -829,28 +951,20 @@ def rst_generate_subpages(ymlfname):
                 assert isinstance(
                     things[0][0], str
                 ), "expected the first entry to be a string"
-                out += things[0][0] + "\n\n"
+                intro = things[0][0]
                 things = things[1:]
-            out += ".. cpp:namespace-pop::\n\n"
-            for thing in sorted(things):
-                try:
-                    (
-                        thing_name,
-                        thing_params,
-                    ) = extract_yml_func_signature(thing)
-
-                    if thing_params == "(bool(*)())":
-                        # TODO improve this
-                        thing = thing_name + "(bool (*func)())"
-                    thing_name = name + "::" + thing_name
-                    out += rst_doxy(
-                        doxy_kind(ymlfname, thing_name, thing_params),
-                        name,
-                        thing,
-                    )
-                except:
-                    doxy_warn(ymlfname, thing_name, thing_params)
-            __write_file_if_changed(rstfname, out)
+            things = sorted(things)
+            if out is not None:
+                out += rst_overview_table(ymlfname, name, things)
+            subpages.append(
+                (rstfname, rst_subpage(ymlfname, name, subname, intro, things))
+            )
+        if out is not None:
+            out += toc + "\n"
+    if out is not None:
+        __write_file_if_changed(overview_filename(name), out)
+    for rstfname, subpage in subpages:
+        __write_file_if_changed(rstfname, subpage)
 
 
 ########################################################################
@@ -858,7 +972,46 @@ def rst_generate_subpages(ymlfname):
 ########################################################################
 
 
+def __process_yml(ymlfname, last_changed_input):
+    # Runs in a worker process, so the output and the global counters are
+    # collected here and returned to main rather than written directly.
+    global __REWRITES_ATTEMPTED, __REWRITES_ACTUAL, __WARNINGS
+    __REWRITES_ATTEMPTED, __REWRITES_ACTUAL, __WARNINGS = 0, 0, 0
+    __RST_FILES_WRITTEN.clear()
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = io.StringIO(), io.StringIO()
+    try:
+        __lines_o_hash(1)
+        __info("Processing %s . . ." % os.path.basename(ymlfname))
+        __lines_o_hash(1)
+        ymldic = __load_yml(ymlfname)
+        # If the rst files were generated from ymlfname after it, this
+        # script, and the doxygen output last changed, then there's nothing
+        # to do.
+        rstfnames = rst_filenames(ymldic)
+        stampfname = __yml_cache_filename(ymlfname, ".stamp")
+        last_changed_input = max(last_changed_input, __mtime(ymlfname))
+        if rst_is_up_to_date(stampfname, rstfnames, last_changed_input):
+            __info("NOT processing docs/%s, it is up to date" % ymlfname)
+            __RST_FILES_WRITTEN.update(os.path.normpath(x) for x in rstfnames)
+        else:
+            rst_generate(ymlfname, ymldic)
+            with open(stampfname, "w"):
+                pass
+        return (
+            list(__RST_FILES_WRITTEN),
+            __REWRITES_ATTEMPTED,
+            __REWRITES_ACTUAL,
+            __WARNINGS,
+            sys.stdout.getvalue(),
+            sys.stderr.getvalue(),
+        )
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
 def main():
+    global __REWRITES_ATTEMPTED, __REWRITES_ACTUAL, __WARNINGS
     if sys.version_info[0] < 3:
         raise Exception("Python 3 is required")
     __lines_o_hash(2)
@@ -879,14 +1032,21 @@ def main():
         os.mkdir("source/_generated")
     except FileExistsError:
         pass
-    for fname in sorted(os.listdir("yml")):
-        if fname[0] != ".":
-            __lines_o_hash(1)
-            __info("Processing %s . . ." % fname)
-            __lines_o_hash(1)
-            fname = os.path.join("yml", fname)
-            rst_generate_overview(fname)
-            rst_generate_subpages(fname)
+    with os.scandir("yml") as it:
+        ymlfnames = sorted(x.path for x in it if x.name[0] != ".")
+    last_changed_input = max(__mtime(__file__), doxy_last_modified())
+    with ProcessPoolExecutor() as executor:
+        for result in executor.map(
+            __process_yml, ymlfnames, itertools.repeat(last_changed_input)
+        ):
+            written, attempted, actual, warnings, out, err = result
+            __RST_FILES_WRITTEN.update(written)
+            __REWRITES_ATTEMPTED += attempted
+            __REWRITES_ACTUAL += actual
+            __WARNINGS += warnings
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+            sys.stdout.flush()
     __clean_up()
     __summary()
 